@@ -0,0 +1,119 @@
+import re
+from functools import lru_cache
+from timeit import timeit
+from typing import Annotated, NamedTuple, Optional
+
+from pydantic import AfterValidator, BaseModel, Field, PlainSerializer, PlainValidator, TypeAdapter
+
+# ASCII digits without leading zeros, so str(PortName) gives back the exact input
+NUMBER = r"(0|[1-9][0-9]*)"
+PORT_RE = re.compile(rf"(xe|ge|et)-{NUMBER}/{NUMBER}/{NUMBER}(?::{NUMBER})?")
+
+
+class PortName(NamedTuple):
+    prefix: str
+    fpc: int
+    pic: int
+    port: int
+    channel: Optional[int] = None
+
+    def __str__(self) -> str:
+        name = f"{self.prefix}-{self.fpc}/{self.pic}/{self.port}"
+        return name if self.channel is None else f"{name}:{self.channel}"
+
+
+@lru_cache(maxsize=65536)
+def parse_port(value: str) -> PortName:
+    """Parse a port name, repeated names get the same PortName instance back."""
+    if not isinstance(value, str):
+        raise ValueError("Port name must be a string")
+    elif not (match := PORT_RE.fullmatch(value)):
+        raise ValueError(f"Invalid port name: {value!r}")
+    prefix, fpc, pic, port, channel = match.groups()
+    return PortName(prefix, int(fpc), int(pic), int(port), None if channel is None else int(channel))
+
+
+def port_validator(value: PortName | str) -> PortName:
+    if isinstance(value, PortName):
+        return value
+    # Checked before the cached call, a list can not be hashed by lru_cache
+    if not isinstance(value, str):
+        raise ValueError("Port name must be a string")
+    return parse_port(value)
+
+
+def validate_ports(values: list[str]) -> list[PortName]:
+    """Validate a full interface table, parsing every distinct port name only once."""
+    parsed = {value: parse_port(value) for value in set(values)}
+    return [parsed[value] for value in values]
+
+
+Port = Annotated[
+    PortName,
+    PlainValidator(port_validator),
+    PlainSerializer(str, return_type=str, when_used="always"),
+]
+
+
+class Interface(BaseModel):
+    hostname: str = Field(min_length=1)
+    port: Port
+
+
+interface = Interface(hostname="Switch-1", port="ge-0/1/2:3")
+print(interface)
+print(interface.port.pic)
+print(interface.model_dump_json())
+
+# hostname='Switch-1' port=PortName(prefix='ge', fpc=0, pic=1, port=2, channel=3)
+# 1
+# {"hostname":"Switch-1","port":"ge-0/1/2:3"}
+
+print(validate_ports(["xe-0/0/0", "xe-0/0/0"])[1] is validate_ports(["xe-0/0/0"])[0])
+
+# True
+
+for port in ("xe-00/0/0", "xe-0/0/0\n", "xe-٠/0/0", 5, ["xe-0/0/0"]):
+    try:
+        Interface(hostname="Switch-1", port=port)
+    except ValueError as e:
+        print(e.errors()[0]["msg"])
+
+# Value error, Invalid port name: 'xe-00/0/0'
+# Value error, Invalid port name: 'xe-0/0/0\n'
+# Value error, Invalid port name: 'xe-٠/0/0'
+# Value error, Port name must be a string
+# Value error, Port name must be a string
+
+
+# The two versions from 01_regex.py and 02_pattern_instead.py
+def regex_port_validator(value: str) -> str:
+    port_re = re.compile(r"^(xe|ge|et)-\d+/\d+/\d+(:\d+)?$")
+
+    if not isinstance(value, str):
+        raise TypeError("Port name must be a string")
+    elif not value:
+        raise ValueError("Invalid port name")
+    elif not port_re.match(value):
+        raise ValueError(f"Invalid port name: {value}")
+
+    return value
+
+
+AfterValidatorPort = Annotated[str, AfterValidator(regex_port_validator)]
+PatternPort = Annotated[str, Field(pattern=r"^(xe|ge|et)-\d+/\d+/\d+(:\d+)?$")]
+
+# 1M rows, but only 48 switches x 48 ports distinct names
+ports = [f"{'xge'[i % 2]}e-{i % 48}/0/{i // 48 % 48}" for i in range(1_000_000)]
+for name, validate in (
+    ("AfterValidator", TypeAdapter(list[AfterValidatorPort]).validate_python),
+    ("Field(pattern=...)", TypeAdapter(list[PatternPort]).validate_python),
+    ("Port", TypeAdapter(list[Port]).validate_python),
+    ("validate_ports", validate_ports),
+):
+    print(f"{name:<20} {timeit(lambda: validate(ports), number=1):.3f}s")
+
+# AfterValidator       1.512s
+# Field(pattern=...)   0.104s
+# Port                 0.391s
+# validate_ports       0.103s
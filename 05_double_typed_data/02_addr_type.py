@@ -0,0 +1,149 @@
+import json
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv4Interface
+from operator import attrgetter
+from time import perf_counter
+from typing import Annotated, Any, Literal, NamedTuple, Optional
+
+from deepdiff import DeepDiff
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, SerializationInfo
+from rich import print as pprint
+
+
+class PackedInterface(NamedTuple):
+    address: int
+    prefixlen: int
+
+    @property
+    def interface(self) -> IPv4Interface:
+        return IPv4Interface((self.address, self.prefixlen))
+
+    def __str__(self) -> str:
+        return format_interface(self)
+
+
+@lru_cache(maxsize=65536)
+def parse_interface(value: Any) -> PackedInterface:
+    """Parse once per distinct value, repeated addresses share the same PackedInterface.
+
+    Like the IPv4Interface validator of pydantic, anything IPv4Interface() takes is
+    accepted: strings, ints, addresses, networks and (address, prefix) tuples.
+    """
+    interface = IPv4Interface(value)
+    return PackedInterface(int(interface.ip), interface.network.prefixlen)
+
+
+@lru_cache(maxsize=65536)
+def format_interface(value: PackedInterface) -> str:
+    return f"{IPv4Address(value.address)}/{value.prefixlen}"
+
+
+def addr_validator(value: Any) -> PackedInterface | list[PackedInterface] | Literal[""]:
+    # One type check picks the shape, instead of trying the union members left to right
+    if value == "" and isinstance(value, str):
+        return value
+    try:
+        if isinstance(value, list):
+            return [parse_interface(item) for item in value]
+        return parse_interface(value)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid IPv4 interface: {value}") from e
+
+
+def addr_serializer(value: PackedInterface | list[PackedInterface] | Literal[""], info: SerializationInfo) -> Any:
+    # JSON gets the strings, Python mode the IPv4Interface objects of the union it replaces
+    convert = format_interface if info.mode_is_json() else attrgetter("interface")
+    if isinstance(value, list):
+        return [convert(item) for item in value]
+    return value if value == "" else convert(value)
+
+
+Addr = Annotated[
+    PackedInterface | list[PackedInterface] | Literal[""],
+    PlainValidator(addr_validator),
+    PlainSerializer(addr_serializer, when_used="always"),
+]
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: str | list[str]
+    addr: Optional[Addr] = None
+
+
+class DeviceList(BaseModel):
+    devices: list[NetworkDevice]
+
+
+class UnionNetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: str | list[str]
+    addr: Optional[IPv4Interface | list[IPv4Interface] | Literal[""]] = None
+
+
+class UnionDeviceList(BaseModel):
+    devices: list[UnionNetworkDevice]
+
+
+network_json = {
+    "devices": [
+        {
+            "hostname": "Switch-1",
+            "role": ["core", "distribution"],
+            "addr": ["192.168.1.1/24"],
+        },
+        {
+            "hostname": "Switch-11",
+            "role": "access",
+            "addr": "192.168.2.1/24",
+        },
+        {
+            "hostname": "Switch-88",
+            "role": "core",
+            "addr": "",
+        },
+    ]
+}
+devices = DeviceList(**network_json)
+print(devices.devices[1].addr, devices.devices[1].addr.interface.network)
+
+# 192.168.2.1/24 192.168.2.0/24
+
+dump = devices.model_dump_json(by_alias=True, exclude_none=True)
+new = json.loads(dump)
+if d := DeepDiff(network_json, new, ignore_order=True):
+    pprint(d)  # Should be empty if the JSON matches the model
+else:
+    print("No differences found between the JSON and the model dump.")
+
+# No differences found between the JSON and the model dump.
+
+# The same input and Python mode output as the IPv4Interface union, ints included
+addr_inputs = ["192.168.1.1/24", ["192.168.1.1/24", 3232235777], 3232235777, IPv4Interface("10.0.0.1/8"), (3232235777, 24), ""]
+print(
+    all(
+        NetworkDevice(hostname="x", role="core", addr=addr).model_dump() == UnionNetworkDevice(hostname="x", role="core", addr=addr).model_dump()
+        for addr in addr_inputs
+    ),
+    NetworkDevice(hostname="x", role="core", addr=3232235777).model_dump()["addr"],
+)
+
+# True 192.168.1.1/32
+
+# 100k devices sharing 1024 management addresses
+big_json = {
+    "devices": [
+        {"hostname": f"Switch-{i}", "role": "access", "addr": [f"10.0.{i % 4}.{i % 256}/24"] if i % 2 else f"10.1.{i % 4}.{i % 256}/24"}
+        for i in range(100_000)
+    ]
+}
+for model in (UnionDeviceList, DeviceList):
+    start = perf_counter()
+    devices = model(**big_json)
+    validate = perf_counter() - start
+    start = perf_counter()
+    devices.model_dump_json(by_alias=True, exclude_none=True)
+    print(f"{model.__name__:<16} validate {validate:.3f}s, model_dump_json {perf_counter() - start:.3f}s")
+
+# UnionDeviceList  validate 2.765s, model_dump_json 0.976s
+# DeviceList       validate 0.955s, model_dump_json 0.229s
@@ -0,0 +1,115 @@
+import json
+from hashlib import blake2b
+from ipaddress import IPv4Interface
+from time import perf_counter
+from typing import Literal, NamedTuple, Optional
+
+from pydantic import BaseModel, Field, RootModel
+from rich import print as pprint
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: str | list[str]
+    addr: Optional[IPv4Interface | list[IPv4Interface] | Literal[""]] = None
+
+
+class DynamicDict(RootModel[dict[str, NetworkDevice]]):
+    pass
+
+
+class Delta(NamedTuple):
+    added: list[str]
+    changed: list[str]
+    removed: list[str]
+
+
+# Created once, json.dumps() with arguments builds a new encoder on every call
+canonical_json = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+
+
+def content_hash(value: dict) -> Optional[bytes]:
+    """Hash of the canonical JSON of a device, None when the value is not plain JSON data."""
+    try:
+        return blake2b(canonical_json(value).encode(), digest_size=16).digest()
+    except (TypeError, ValueError):
+        return None
+
+
+class IncrementalValidator:
+    """Validates only the devices that were added or changed since the previous snapshot."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, Optional[bytes]] = {}
+        self.devices = DynamicDict({})
+
+    def update(self, snapshot: dict[str, dict]) -> tuple[DynamicDict, Delta]:
+        hashes = {key: content_hash(val) for key, val in snapshot.items()}
+        added = [key for key in hashes if key not in self.hashes]
+        # A device without a hash, like one holding an IPv4Interface instead of a string, is always validated again
+        changed = [key for key, digest in hashes.items() if key in self.hashes and (digest is None or self.hashes[key] != digest)]
+        removed = [key for key in self.hashes if key not in hashes]
+
+        # A ValidationError leaves the previous state untouched
+        validated = DynamicDict.model_validate({key: snapshot[key] for key in added + changed}).root
+        previous = self.devices.root
+        self.devices = DynamicDict.model_construct({key: validated[key] if key in validated else previous[key] for key in snapshot})
+        self.hashes = hashes
+        return self.devices, Delta(added, changed, removed)
+
+
+some_json = {
+    "random1": {
+        "hostname": "Switch-1",
+        "role": ["core", "distribution"],
+        "addr": ["192.168.1.1/24"],
+    },
+    "random2": {
+        "hostname": "Switch-11",
+        "role": "access",
+        "addr": "192.168.2.1/24",
+    },
+    "random3": {
+        "hostname": "Switch-88",
+        "role": "core",
+        "addr": "",
+    },
+}
+validator = IncrementalValidator()
+devices, delta = validator.update(some_json)
+pprint(delta)
+
+# Delta(added=['random1', 'random2', 'random3'], changed=[], removed=[])
+
+next_json = {
+    "random1": some_json["random1"],
+    "random2": {**some_json["random2"], "addr": "192.168.2.2/24"},
+    "random4": {"hostname": "Switch-99", "role": "access"},
+}
+devices, delta = validator.update(next_json)
+pprint(delta)
+print(devices.model_dump_json(by_alias=True, exclude_none=True))
+
+# Delta(added=['random4'], changed=['random2'], removed=['random3'])
+# {"random1":{"hostname":"Switch-1","role":["core","distribution"],"addr":["192.168.1.1/24"]},
+#  "random2":{"hostname":"Switch-11","role":"access","addr":"192.168.2.2/24"},"random4":{"hostname":"Switch-99","role":"access"}}
+
+# A fleet of 100k devices where 1% changes between polls
+fleet = {
+    f"random{i}": {"hostname": f"Switch-{i}", "role": "access", "addr": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/24"} for i in range(100_000)
+}
+validator = IncrementalValidator()
+validator.update(fleet)
+for i in range(0, 100_000, 100):
+    fleet[f"random{i}"] = {**fleet[f"random{i}"], "role": "core"}
+
+start = perf_counter()
+DynamicDict(fleet)
+print(f"full validation: {perf_counter() - start:.3f}s")
+start = perf_counter()
+devices, delta = validator.update(fleet)
+print(f"incremental: {perf_counter() - start:.3f}s for {len(delta.changed)} changed devices")
+
+# full validation: 2.587s
+# incremental: 0.767s for 1000 changed devices
+# What is left is hashing every entry of the snapshot, which is far cheaper than validating it.
@@ -0,0 +1,180 @@
+import json
+import marshal
+import os
+import shutil
+import tempfile
+from hashlib import blake2b, file_digest
+from ipaddress import IPv4Interface
+from itertools import batched
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field, RootModel
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: str | list[str]
+    addr: Optional[IPv4Interface | list[IPv4Interface] | Literal[""]] = None
+
+
+class OtherDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    id: int
+    addr: IPv4Interface
+
+
+class DynamicDict(RootModel[dict[str, NetworkDevice | OtherDevice]]):
+    pass
+
+
+DEVICE_MODELS = (NetworkDevice, OtherDevice)
+
+
+def schema_fingerprint(model: type[BaseModel]) -> str:
+    """Changes with every change to the fields or constraints of the model."""
+    schema = json.dumps(model.model_json_schema(), sort_keys=True)
+    return blake2b(schema.encode(), digest_size=8).hexdigest()
+
+
+def source_hash(path: Path) -> str:
+    with path.open("rb") as f:
+        return file_digest(f, lambda: blake2b(digest_size=16)).hexdigest()
+
+
+def pack(value: Any) -> Any:
+    # An interface as (address, prefixlen) is built without parsing a string, the models use no tuples themselves
+    if isinstance(value, IPv4Interface):
+        return (int(value.ip), value.network.prefixlen)
+    if isinstance(value, list):
+        return [pack(item) for item in value]
+    return value
+
+
+def unpack(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return IPv4Interface(value)
+    if isinstance(value, list):
+        return [unpack(item) for item in value]
+    return value
+
+
+class ShardedCache:
+    """Validated DynamicDict snapshots on disk, split in shards of sorted keys.
+
+    A snapshot is stored under the hash of the source file and the schema
+    fingerprint of the model, changing either one is a cache miss. Devices are
+    stored as marshal records (key, source position, model, fields set, packed
+    values) and loaded with model_construct in the order of the source, without
+    running the validators again.
+    """
+
+    def __init__(self, directory: Path, shard_size: int = 10_000) -> None:
+        self.directory = directory
+        self.shard_size = shard_size
+        self.fingerprint = f"{schema_fingerprint(DynamicDict)}-m{marshal.version}"
+
+    def snapshot_dir(self, source: Path) -> Path:
+        return self.directory / f"{source_hash(source)}-{self.fingerprint}"
+
+    def store(self, source: Path, devices: DynamicDict) -> None:
+        target = self.snapshot_dir(source)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=self.directory))
+        index = []
+        positions = {key: position for position, key in enumerate(devices.root)}
+        for number, keys in enumerate(batched(sorted(devices.root), self.shard_size)):
+            records = []
+            for key in keys:
+                device = devices.root[key]
+                fields = list(type(device).model_fields)
+                fields_set = sum(1 << fields.index(name) for name in device.model_fields_set)
+                values = tuple(pack(getattr(device, name)) for name in fields)
+                records.append((key, positions[key], DEVICE_MODELS.index(type(device)), fields_set, values))
+            name = f"shard-{number:05}.bin"
+            (tmp / name).write_bytes(marshal.dumps(records))
+            index.append((keys[0], keys[-1], name))
+        (tmp / "index.json").write_text(json.dumps(index))
+        # Readers see a complete snapshot or none at all
+        try:
+            os.rename(tmp, target)
+        except OSError:
+            shutil.rmtree(tmp)  # another worker stored the same snapshot first
+
+    def load(self, source: Path, start: Optional[str] = None, stop: Optional[str] = None) -> Optional[DynamicDict]:
+        """The devices with start <= key < stop, or None when the snapshot is not cached."""
+        snapshot = self.snapshot_dir(source)
+        try:
+            index = json.loads((snapshot / "index.json").read_text())
+        except FileNotFoundError:
+            return None
+        loaded = []
+        for first, last, name in index:
+            if (stop is not None and first >= stop) or (start is not None and last < start):
+                continue
+            for key, position, model_index, fields_set, values in marshal.loads((snapshot / name).read_bytes()):
+                if (start is not None and key < start) or (stop is not None and key >= stop):
+                    continue
+                model = DEVICE_MODELS[model_index]
+                fields = list(model.model_fields)
+                device = model.model_construct(
+                    {field for bit, field in enumerate(fields) if fields_set & 1 << bit},
+                    **{field: unpack(value) for field, value in zip(fields, values)},
+                )
+                loaded.append((position, key, device))
+        # Shards are sorted by key, the devices go back in the order of the source file
+        loaded.sort()
+        return DynamicDict.model_construct({key: device for _, key, device in loaded})
+
+    def load_or_validate(self, source: Path, start: Optional[str] = None, stop: Optional[str] = None) -> DynamicDict:
+        if (devices := self.load(source, start, stop)) is not None:
+            return devices
+        devices = DynamicDict.model_validate_json(source.read_bytes())
+        self.store(source, devices)
+        return self.load(source, start, stop)
+
+
+some_json = {
+    "random1": {"hostname": "Switch-1", "role": ["core", "distribution"], "addr": ["192.168.1.1/24"]},
+    "random2": {"hostname": "Switch-11", "role": "access", "addr": "192.168.2.1/24"},
+    "other_random3": {"hostname": "OtherDevice-88", "id": 5, "addr": "192.168.30.250/24"},
+}
+with tempfile.TemporaryDirectory() as tmp:
+    source = Path(tmp) / "devices.json"
+    source.write_text(json.dumps(some_json))
+    cache = ShardedCache(Path(tmp) / "cache", shard_size=2)
+    cache.load_or_validate(source)
+    cached = cache.load(source)
+    fresh = DynamicDict(some_json)
+    print(cached == fresh, cached.model_dump_json(exclude_unset=True) == fresh.model_dump_json(exclude_unset=True))
+    print(list(cache.load(source, start="random", stop="random2").root))
+
+# True True
+# ['random1']
+
+# 100k devices, 4 workers that each load a quarter of the keys
+big_json = {
+    f"random{i:06}": {"hostname": f"Switch-{i}", "role": "access", "addr": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/24"} for i in range(100_000)
+}
+with tempfile.TemporaryDirectory() as tmp:
+    source = Path(tmp) / "devices.json"
+    source.write_text(json.dumps(big_json))
+    cache = ShardedCache(Path(tmp) / "cache")
+    start = perf_counter()
+    devices = DynamicDict.model_validate_json(source.read_bytes())
+    print(f"validate:         {perf_counter() - start:.3f}s")
+    start = perf_counter()
+    cache.store(source, devices)
+    print(f"store:            {perf_counter() - start:.3f}s")
+    start = perf_counter()
+    cache.load(source)
+    print(f"load all:         {perf_counter() - start:.3f}s")
+    start = perf_counter()
+    cache.load(source, start="random025000", stop="random050000")
+    print(f"load one quarter: {perf_counter() - start:.3f}s")
+
+# validate:         3.330s
+# store:            0.972s
+# load all:         2.988s
+# load one quarter: 0.659s
@@ -0,0 +1,148 @@
+import gzip
+import io
+import tracemalloc
+from contextlib import contextmanager
+from ipaddress import IPv4Interface
+from itertools import batched, islice
+from time import perf_counter
+from typing import Any, BinaryIO, Iterator, Literal, Optional
+
+from pydantic import BaseModel, Field, RootModel, TypeAdapter
+
+try:
+    from compression import zstd  # Python 3.14 and newer
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: str | list[str]
+    addr: Optional[IPv4Interface | list[IPv4Interface] | Literal[""]] = None
+
+
+class OtherDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    id: int
+    addr: IPv4Interface
+
+
+class DynamicDict(RootModel[dict[str, NetworkDevice | OtherDevice]]):
+    pass
+
+
+# Serializes a part of the root dict exactly like DynamicDict does for the whole dict
+ROOT_ADAPTER = TypeAdapter(DynamicDict.model_fields["root"].annotation)
+
+
+@contextmanager
+def compressed(stream: BinaryIO, compression: Optional[Literal["gzip", "zstd"]]) -> Iterator[BinaryIO]:
+    """Compress on the fly, closing the compressor flushes it but leaves `stream` open."""
+    if compression is None:
+        yield stream
+    elif compression == "gzip":
+        with gzip.GzipFile(fileobj=stream, mode="wb") as f:
+            yield f
+    elif compression == "zstd":
+        if zstd is None:
+            raise ValueError("zstd compression needs Python 3.14 or the zstandard package")
+        if hasattr(zstd, "ZstdFile"):
+            with zstd.ZstdFile(stream, "w") as f:
+                yield f
+        else:
+            with zstd.ZstdCompressor().stream_writer(stream, closefd=False) as f:
+                yield f
+    else:
+        raise ValueError(f"unknown compression '{compression}'")
+
+
+def write_json(
+    devices: DynamicDict,
+    stream: BinaryIO,
+    chunk_size: int = 1000,
+    compression: Optional[Literal["gzip", "zstd"]] = None,
+    indent: Optional[int] = 2,
+    **dump_args: Any,
+) -> None:
+    """Write the same bytes as devices.model_dump_json(indent=indent, **dump_args), `chunk_size` devices at a time.
+
+    Only one chunk is in memory at a time, `stream` can be a file or socket.makefile("wb").
+    """
+    root = devices.root
+    written = False
+    with compressed(stream, compression) as out:
+        for chunk in batched(root, chunk_size):
+            # A dumped chunk is "{...}", the devices in it are already indented for the top level
+            dumped = ROOT_ADAPTER.dump_json({key: root[key] for key in chunk}, indent=indent, **dump_args)
+            if dumped == b"{}":
+                continue  # every device of the chunk was left out by include or exclude
+            body = dumped[1 : dumped.rindex(b"\n")] if indent is not None else dumped[1:-1]
+            out.write((b"," if written else b"{") + body)
+            written = True
+        if not written:
+            out.write(b"{}")
+        else:
+            out.write(b"\n}" if indent is not None else b"}")
+
+
+some_json = {
+    "random1": {
+        "hostname": "Switch-1",
+        "role": ["core", "distribution"],
+        "addr": ["192.168.1.1/24"],
+    },
+    "random2": {
+        "hostname": "Switch-11",
+        "role": "access",
+        "addr": "192.168.2.1/24",
+    },
+    "other_random3": {
+        "hostname": "OtherDevice-88",
+        "id": 5,
+        "addr": "192.168.30.250/24",
+    },
+}
+devices = DynamicDict(some_json)
+expected = devices.model_dump_json(by_alias=True, exclude_none=True, indent=2).encode()
+for compression in (None, "gzip"):
+    stream = io.BytesIO()
+    write_json(devices, stream, chunk_size=2, compression=compression, by_alias=True, exclude_none=True)
+    written = stream.getvalue() if compression is None else gzip.decompress(stream.getvalue())
+    print(compression, written == expected)
+
+# None True
+# gzip True
+
+# Memory of the whole dump against the streamed dump, for a growing number of devices
+big_json = {
+    f"random{i}": {"hostname": f"Switch-{i}", "role": "access", "addr": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/24"}
+    if i % 10
+    else {"hostname": f"Other-{i}", "id": i, "addr": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/24"}
+    for i in range(200_000)
+}
+for size in (50_000, 200_000):
+    devices = DynamicDict(dict(islice(big_json.items(), size)))
+    for name, dump in (
+        ("model_dump_json", lambda stream: stream.write(devices.model_dump_json(by_alias=True, exclude_none=True, indent=2).encode())),
+        ("write_json", lambda stream: write_json(devices, stream, by_alias=True, exclude_none=True)),
+        ("write_json gzip", lambda stream: write_json(devices, stream, compression="gzip", by_alias=True, exclude_none=True)),
+    ):
+        with open("/dev/null", "wb") as stream:
+            start = perf_counter()
+            dump(stream)
+            seconds = perf_counter() - start
+            tracemalloc.start()
+            dump(stream)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        print(f"{size:>7} {name:<16} {seconds:.3f}s, peak {peak / 2**20:.1f} MiB")
+
+#   50000 model_dump_json  0.372s, peak 10.1 MiB
+#   50000 write_json       0.347s, peak 0.3 MiB
+#   50000 write_json gzip  0.572s, peak 0.7 MiB
+#  200000 model_dump_json  1.176s, peak 41.0 MiB
+#  200000 write_json       1.172s, peak 0.3 MiB
+#  200000 write_json gzip  2.026s, peak 0.7 MiB
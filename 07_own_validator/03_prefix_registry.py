@@ -0,0 +1,128 @@
+import json
+from functools import lru_cache
+from ipaddress import IPv4Interface
+from string import digits
+from typing import Iterator, Optional
+
+from deepdiff import DeepDiff
+from pydantic import BaseModel, Field, ValidationError
+from rich import print as pprint
+
+some_json = {
+    "devices": {
+        "rtr1": {"hostname": "Router-1", "role": ["core"], "addr": "192.168.1.1/24", "monitor": True},
+        "rtr2": {"hostname": "Router-2", "role": ["core"], "addr": "192.168.1.2/24", "monitor": False},
+        "switch1": {"hostname": "Switch-1", "role": ["access"], "addr": "192.168.10.1/24", "id": 532},
+        "switch2": {"hostname": "Switch-2", "role": ["access"], "addr": "192.168.10.2/24", "id": 321},
+        "console1": {"hostname": "Console-1", "role": ["management"], "addr": "172.16.0.1/24", "instance-id": 456},
+        "console2": {"hostname": "Console-2", "role": ["management"], "addr": "172.16.0.2/24"},
+    },
+}
+
+NETWORK_DEVICE_REGISTRY: dict[str, type[BaseModel]] = {}
+_REGISTRY_TRIE: dict = {}
+_MODEL = object()  # marks a trie node where a registered prefix ends
+
+
+def register_device(prefix: str):
+    """Register a model class for all device keys starting with `prefix`."""
+
+    def decorator(cls: type[BaseModel]) -> type[BaseModel]:
+        NETWORK_DEVICE_REGISTRY[prefix] = cls
+        node = _REGISTRY_TRIE
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[_MODEL] = cls
+        lookup_model_class.cache_clear()
+        return cls
+
+    return decorator
+
+
+@lru_cache(maxsize=4096)
+def lookup_model_class(stem: str) -> type[BaseModel] | None:
+    """Longest prefix match of `stem` in the registry trie."""
+    node = _REGISTRY_TRIE
+    match = node.get(_MODEL)
+    for char in stem:
+        node = node.get(char)
+        if node is None:
+            break
+        match = node.get(_MODEL, match)
+    return match
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: list[str]
+    addr: IPv4Interface
+
+
+@register_device("rtr")
+class NetworkDeviceRtr(NetworkDevice):
+    monitor: bool
+
+
+@register_device("switch")
+class NetworkDeviceSwitch(NetworkDevice):
+    id: int
+
+
+@register_device("console")
+class NetworkDeviceConsole(NetworkDevice):
+    instance_id: Optional[int] = Field(None, alias="instance-id")
+
+
+class NetworkDeviceDict(dict[str, BaseModel]):
+    @classmethod
+    def __get_validators__(cls) -> Iterator:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: dict[str, dict], info=None) -> "NetworkDeviceDict":  # noqa: ARG003
+        if not isinstance(value, dict):
+            raise TypeError("devices must be a dict")
+        result = {}
+        for key, val in value.items():
+            # "rtr1", "rtr2", ... share the stem "rtr", so the lookup is memoized per device type
+            model_class = lookup_model_class(key.rstrip(digits))
+            if not model_class:
+                raise ValueError(f"key '{key}' not in NETWORK_DEVICE_REGISTRY")
+            try:
+                result[key] = model_class(**val)
+            except ValidationError as e:
+                pprint(f"Validation error for {key}: {e}")
+        return cls(result)
+
+
+class DeviceList(BaseModel):
+    devices: NetworkDeviceDict
+
+
+devices = DeviceList(**some_json)
+pprint(devices.model_dump_json(by_alias=True, exclude_none=True, indent=2))
+
+dump = devices.model_dump_json(by_alias=True, exclude_none=True)
+new = json.loads(dump)
+if d := DeepDiff(some_json, new, ignore_order=True):
+    pprint(d)  # Should be empty if the JSON matches the model
+else:
+    print("No differences found between the JSON and the model dump.")
+
+# No differences found between the JSON and the model dump.
+
+
+# Adding a device type is a single decorator, the validator itself does not change.
+# A longer prefix wins over a shorter one, so "rtrcore" does not end up as a NetworkDeviceRtr.
+@register_device("rtrcore")
+class NetworkDeviceCoreRtr(NetworkDeviceRtr):
+    area: int
+
+
+print(lookup_model_class("rtr").__name__)
+print(lookup_model_class("rtrcore").__name__)
+print(lookup_model_class("firewall"))
+
+# NetworkDeviceRtr
+# NetworkDeviceCoreRtr
+# None
@@ -0,0 +1,162 @@
+import json
+from functools import cache, lru_cache
+from ipaddress import IPv4Interface
+from string import digits
+from time import perf_counter
+from typing import Iterator, Optional
+
+from deepdiff import DeepDiff
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from rich import print as pprint
+
+some_json = {
+    "devices": {
+        "rtr1": {"hostname": "Router-1", "role": ["core"], "addr": "192.168.1.1/24", "monitor": True},
+        "rtr2": {"hostname": "Router-2", "role": ["core"], "addr": "192.168.1.2/24", "monitor": False},
+        "switch1": {"hostname": "Switch-1", "role": ["access"], "addr": "192.168.10.1/24", "id": 532},
+        "switch2": {"hostname": "Switch-2", "role": ["access"], "addr": "192.168.10.2/24", "id": 321},
+        "console1": {"hostname": "Console-1", "role": ["management"], "addr": "172.16.0.1/24", "instance-id": 456},
+        "console2": {"hostname": "Console-2", "role": ["management"], "addr": "172.16.0.2/24"},
+    },
+}
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: list[str]
+    addr: IPv4Interface
+
+
+class NetworkDeviceRtr(NetworkDevice):
+    monitor: bool
+
+
+class NetworkDeviceSwitch(NetworkDevice):
+    id: int
+
+
+class NetworkDeviceConsole(NetworkDevice):
+    instance_id: Optional[int] = Field(None, alias="instance-id")
+
+
+NETWORK_DEVICE_REGISTRY = {
+    "rtr": NetworkDeviceRtr,
+    "switch": NetworkDeviceSwitch,
+    "console": NetworkDeviceConsole,
+}
+
+
+@lru_cache(maxsize=4096)
+def lookup_model_class(stem: str) -> type[BaseModel] | None:
+    for prefix in sorted(NETWORK_DEVICE_REGISTRY, key=len, reverse=True):
+        if stem.startswith(prefix):
+            return NETWORK_DEVICE_REGISTRY[prefix]
+    return None
+
+
+@cache
+def list_adapter(model_class: type[BaseModel]) -> TypeAdapter:
+    """One TypeAdapter per model class, built on first use and reused afterwards."""
+    return TypeAdapter(list[model_class])
+
+
+class NetworkDeviceDict(dict[str, BaseModel]):
+    @classmethod
+    def __get_validators__(cls) -> Iterator:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: dict[str, dict], info=None) -> "NetworkDeviceDict":  # noqa: ARG003
+        if not isinstance(value, dict):
+            raise TypeError("devices must be a dict")
+        result = {}
+        for key, val in value.items():
+            model_class = lookup_model_class(key.rstrip(digits))
+            if not model_class:
+                raise ValueError(f"key '{key}' not in NETWORK_DEVICE_REGISTRY")
+            try:
+                result[key] = model_class(**val)
+            except ValidationError as e:
+                pprint(f"Validation error for {key}: {e}")
+        return cls(result)
+
+
+class BatchNetworkDeviceDict(NetworkDeviceDict):
+    """Same result as NetworkDeviceDict, but validates all devices of a model class in one call."""
+
+    @classmethod
+    def validate(cls, value: dict[str, dict], info=None) -> "BatchNetworkDeviceDict":  # noqa: ARG003
+        if not isinstance(value, dict):
+            raise TypeError("devices must be a dict")
+        groups: dict[type[BaseModel], tuple[list[str], list[dict]]] = {}
+        for key, val in value.items():
+            model_class = lookup_model_class(key.rstrip(digits))
+            if not model_class:
+                raise ValueError(f"key '{key}' not in NETWORK_DEVICE_REGISTRY")
+            keys, values = groups.setdefault(model_class, ([], []))
+            keys.append(key)
+            values.append(val)
+
+        validated = {}
+        for model_class, (keys, values) in groups.items():
+            try:
+                validated.update(zip(keys, list_adapter(model_class).validate_python(values)))
+            except ValidationError:
+                # Only a failing group falls back to the per device loop, to report per key
+                for key, val in zip(keys, values):
+                    try:
+                        validated[key] = model_class(**val)
+                    except ValidationError as e:
+                        pprint(f"Validation error for {key}: {e}")
+        # Put the devices back in the order of the input
+        return cls({key: validated[key] for key in value if key in validated})
+
+
+class DeviceList(BaseModel):
+    devices: NetworkDeviceDict
+
+
+class BatchDeviceList(BaseModel):
+    devices: BatchNetworkDeviceDict
+
+
+devices = BatchDeviceList(**some_json)
+pprint(devices.model_dump_json(by_alias=True, exclude_none=True, indent=2))
+
+dump = devices.model_dump_json(by_alias=True, exclude_none=True)
+new = json.loads(dump)
+if d := DeepDiff(some_json, new, ignore_order=True):
+    pprint(d)  # Should be empty if the JSON matches the model
+else:
+    print("No differences found between the JSON and the model dump.")
+
+# No differences found between the JSON and the model dump.
+
+
+def make_devices(n: int) -> dict:
+    return {
+        "devices": {
+            f"{kind}{i}": {**template, "hostname": f"{kind}-{i}"}
+            for i in range(n // 3)
+            for kind, template in (
+                ("rtr", some_json["devices"]["rtr1"]),
+                ("switch", some_json["devices"]["switch1"]),
+                ("console", some_json["devices"]["console1"]),
+            )
+        }
+    }
+
+
+for size in (10_000, 100_000):
+    big_json = make_devices(size)
+    start = perf_counter()
+    DeviceList(**big_json)
+    loop = perf_counter() - start
+    start = perf_counter()
+    BatchDeviceList(**big_json)
+    batch = perf_counter() - start
+    print(f"{size:>7} devices: loop {loop:.3f}s, batch {batch:.3f}s, {loop / batch:.1f}x")
+
+#   10000 devices: loop 0.228s, batch 0.201s, 1.1x
+#  100000 devices: loop 2.680s, batch 2.616s, 1.0x
+# Most of the time goes into the IPv4Interface parsing, which batching does not change.
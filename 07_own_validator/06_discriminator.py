@@ -0,0 +1,120 @@
+import json
+from ipaddress import IPv4Interface
+from time import perf_counter
+from typing import Annotated, Any, Optional, Union
+
+from deepdiff import DeepDiff
+from pydantic import BaseModel, Discriminator, Field, Tag, TypeAdapter, create_model
+from rich import print as pprint
+
+some_json = {
+    "devices": {
+        "rtr1": {"hostname": "Router-1", "role": ["core"], "addr": "192.168.1.1/24", "monitor": True},
+        "newrtr2": {"hostname": "Router-2", "role": ["core"], "addr": "192.168.1.2/24", "monitor": False},
+        "switch1": {"hostname": "Switch-1", "role": ["access"], "addr": "192.168.10.1/24", "id": 532},
+        "switch2": {"hostname": "Switch-2", "role": ["access"], "addr": "192.168.10.2/24", "id": 321},
+        "console1": {"hostname": "Console-1", "role": ["management"], "addr": "172.16.0.1/24", "instance-id": 456},
+        "console2": {"hostname": "Console-2", "role": ["management"], "addr": "172.16.0.2/24"},
+    },
+}
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: list[str]
+    addr: IPv4Interface
+
+
+class NetworkDeviceRtr(NetworkDevice):
+    monitor: bool
+
+
+class NetworkDeviceSwitch(NetworkDevice):
+    id: int
+
+
+class NetworkDeviceConsole(NetworkDevice):
+    instance_id: Optional[int] = Field(None, alias="instance-id")
+
+
+# A device is recognised by the field only its own type has, a device without any of them is a console
+DEVICE_FIELD_TAGS = {"monitor": "rtr", "id": "switch"}
+DEVICE_MODEL_TAGS = {NetworkDeviceRtr: "rtr", NetworkDeviceSwitch: "switch", NetworkDeviceConsole: "console"}
+
+
+def device_kind(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        for key in value:
+            if tag := DEVICE_FIELD_TAGS.get(key):
+                return tag
+        return "console"
+    # Model instances, used when serializing
+    return DEVICE_MODEL_TAGS.get(type(value))
+
+
+Device = Annotated[
+    Annotated[NetworkDeviceRtr, Tag("rtr")] | Annotated[NetworkDeviceSwitch, Tag("switch")] | Annotated[NetworkDeviceConsole, Tag("console")],
+    Discriminator(device_kind),
+]
+
+
+class DeviceList(BaseModel):
+    devices: dict[str, Device]
+
+
+devices = DeviceList(**some_json)
+print({key: type(device).__name__ for key, device in devices.devices.items()})
+
+# {'rtr1': 'NetworkDeviceRtr', 'newrtr2': 'NetworkDeviceRtr', 'switch1': 'NetworkDeviceSwitch', 'switch2': 'NetworkDeviceSwitch',
+#  'console1': 'NetworkDeviceConsole', 'console2': 'NetworkDeviceConsole'}
+
+dump = devices.model_dump_json(by_alias=True, exclude_none=True)
+new = json.loads(dump)
+if d := DeepDiff(some_json, new, ignore_order=True):
+    pprint(d)  # Should be empty if the JSON matches the model
+else:
+    print("No differences found between the JSON and the model dump.")
+
+# No differences found between the JSON and the model dump.
+
+
+# Add more and more device types, each recognised by its own extra field, and compare
+# the plain union (smart mode tries the members) with the discriminated one.
+def benchmark(extra_types: int, per_type: int = 500) -> None:
+    models = {"rtr": NetworkDeviceRtr, "switch": NetworkDeviceSwitch}
+    field_tags = dict(DEVICE_FIELD_TAGS)
+    for n in range(extra_types):
+        models[f"extra{n}"] = create_model(f"NetworkDeviceExtra{n}", __base__=NetworkDevice, **{f"extra{n}": (int, ...)})
+        field_tags[f"extra{n}"] = f"extra{n}"
+    models["console"] = NetworkDeviceConsole
+
+    def kind(value: dict) -> str:
+        for key in value:
+            if tag := field_tags.get(key):
+                return tag
+        return "console"
+
+    plain = TypeAdapter(dict[str, Union[tuple(models.values())]])
+    tagged = TypeAdapter(dict[str, Annotated[Union[tuple(Annotated[model, Tag(tag)] for tag, model in models.items())], Discriminator(kind)]])
+
+    base = {"hostname": "Device", "role": ["core"], "addr": "10.0.0.1/24"}
+    data = {}
+    for tag in models:
+        extra = {"monitor": True} if tag == "rtr" else {"id": 1} if tag == "switch" else {} if tag == "console" else {tag: 1}
+        data.update({f"{tag}{i}": {**base, **extra} for i in range(per_type)})
+
+    timings = []
+    for adapter in (plain, tagged):
+        start = perf_counter()
+        adapter.validate_python(data)
+        timings.append((perf_counter() - start) / len(data) * 1e6)
+    print(f"{len(models):>2} device types: union {timings[0]:.1f} us/device, discriminated {timings[1]:.1f} us/device")
+
+
+for extra_types in (0, 5, 13, 29):
+    benchmark(extra_types)
+
+#  3 device types: union 45.5 us/device, discriminated 20.6 us/device
+#  8 device types: union 149.8 us/device, discriminated 21.0 us/device
+# 16 device types: union 260.9 us/device, discriminated 23.5 us/device
+# 32 device types: union 494.0 us/device, discriminated 24.2 us/device
@@ -0,0 +1,222 @@
+import json
+from abc import abstractmethod
+from collections.abc import Iterator, Mapping
+from ipaddress import IPv4Interface
+from itertools import batched
+from string import digits
+from time import perf_counter
+from typing import Any, Literal, Optional
+
+from deepdiff import DeepDiff
+from pydantic import BaseModel, Field, GetCoreSchemaHandler, RootModel, SerializationInfo, SerializeAsAny, TypeAdapter, ValidationInfo
+from pydantic_core import core_schema
+from rich import print as pprint
+
+some_json = {
+    "devices": {
+        "rtr1": {"hostname": "Router-1", "role": ["core"], "addr": "192.168.1.1/24", "monitor": True},
+        "rtr2": {"hostname": "Router-2", "role": ["core"], "addr": "192.168.1.2/24", "monitor": False},
+        "switch1": {"hostname": "Switch-1", "role": ["access"], "addr": "192.168.10.1/24", "id": 532},
+        "switch2": {"hostname": "Switch-2", "role": ["access"], "addr": "192.168.10.2/24", "id": 321},
+        "console1": {"hostname": "Console-1", "role": ["management"], "addr": "172.16.0.1/24", "instance-id": 456},
+        "console2": {"hostname": "Console-2", "role": ["management"], "addr": "172.16.0.2/24"},
+    },
+}
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: list[str]
+    addr: IPv4Interface
+
+
+class NetworkDeviceRtr(NetworkDevice):
+    monitor: bool
+
+
+class NetworkDeviceSwitch(NetworkDevice):
+    id: int
+
+
+class NetworkDeviceConsole(NetworkDevice):
+    instance_id: Optional[int] = Field(None, alias="instance-id")
+
+
+NETWORK_DEVICE_REGISTRY = {
+    "rtr": NetworkDeviceRtr,
+    "switch": NetworkDeviceSwitch,
+    "console": NetworkDeviceConsole,
+}
+
+
+# Dumps a batch of devices with the include and exclude of the whole dict, so pydantic applies them exactly as for an eager dict
+DUMP_ADAPTER = TypeAdapter(dict[str, SerializeAsAny[BaseModel]])
+
+
+def left_out(key: str, include: Any, exclude: Any) -> bool:
+    """True when include or exclude drop the whole entry, so it does not have to be validated for a dump."""
+    if include is not None and key not in include and "__all__" not in include:
+        return True
+    if isinstance(exclude, (set, frozenset)):
+        return key in exclude or "__all__" in exclude
+    return exclude is not None and (exclude[key] if key in exclude else exclude.get("__all__")) is True
+
+
+class LazyModelDict(Mapping[str, BaseModel]):
+    """Keeps the raw devices and only validates a device when it is read.
+
+    Validation errors of a device show up when it is read, call validate_all()
+    to check every device. A dump has the same output as an eagerly validated
+    dict: devices that were not read yet are validated for the dump, but they
+    are not kept, so memory stays at the devices that were read. The raw
+    entries are not written as they are, they may be invalid or in another form
+    than the dump (aliases, coerced values). A dump of untouched devices costs a
+    validation each time, call validate_all() first to dump them repeatedly.
+    """
+
+    def __init__(self, raw: dict[str, dict], context: Any = None, batch_size: int = 1000) -> None:
+        self._raw = raw
+        self._context = context  # the validation context of the outer model, used for every device
+        self._batch_size = batch_size
+        self._models: dict[str, BaseModel] = {}
+
+    @classmethod
+    @abstractmethod
+    def model_for(cls, key: str) -> type[BaseModel]: ...
+
+    def _validate(self, key: str) -> BaseModel:
+        return self.model_for(key).model_validate(self._raw[key], context=self._context)
+
+    def __getitem__(self, key: str) -> BaseModel:
+        if (model := self._models.get(key)) is None:
+            self._raw[key]  # a missing key is a KeyError, so get() and `in` work as for a dict
+            model = self._models[key] = self._validate(key)
+        return model
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def validate_all(self) -> "LazyModelDict":
+        for key in self._raw:
+            self[key]
+        return self
+
+    def dump(self, info: SerializationInfo) -> dict[str, Any]:
+        result = {}
+        keys = (key for key in self._raw if not left_out(key, info.include, info.exclude))
+        for batch in batched(keys, self._batch_size):
+            models = {key: self._models.get(key) or self._validate(key) for key in batch}
+            result.update(
+                DUMP_ADAPTER.dump_python(
+                    models,
+                    mode=info.mode,
+                    include=info.include,
+                    exclude=info.exclude,
+                    by_alias=info.by_alias,
+                    exclude_unset=info.exclude_unset,
+                    exclude_defaults=info.exclude_defaults,
+                    exclude_none=info.exclude_none,
+                    round_trip=info.round_trip,
+                    context=info.context,
+                )
+            )
+        return result
+
+    @classmethod
+    def _from_raw(cls, value: Any, info: ValidationInfo) -> "LazyModelDict":
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, dict):
+            raise TypeError("devices must be a dict")
+        for key in value:
+            cls.model_for(key)  # unknown device types are still reported right away
+        return cls(value, info.context)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.with_info_plain_validator_function(
+            cls._from_raw,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda v, info: v.dump(info), info_arg=True),
+        )
+
+
+class LazyNetworkDeviceDict(LazyModelDict):
+    @classmethod
+    def model_for(cls, key: str) -> type[BaseModel]:
+        if model_class := NETWORK_DEVICE_REGISTRY.get(key.rstrip(digits)):
+            return model_class
+        raise ValueError(f"key '{key}' not in NETWORK_DEVICE_REGISTRY")
+
+
+class DeviceList(BaseModel):
+    devices: LazyNetworkDeviceDict
+
+
+class DynamicDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: str | list[str]
+    addr: Optional[IPv4Interface | list[IPv4Interface] | Literal[""]] = None
+
+
+class LazyDynamicDeviceDict(LazyModelDict):
+    @classmethod
+    def model_for(cls, key: str) -> type[BaseModel]:
+        return DynamicDevice
+
+
+class DynamicDict(RootModel[LazyDynamicDeviceDict]):
+    pass
+
+
+devices = DeviceList(**some_json)
+print(devices.devices["switch1"])
+print(len(devices.devices._models))
+
+# hostname='Switch-1' role=['access'] addr=IPv4Interface('192.168.10.1/24') id=532
+# 1
+
+dump = devices.model_dump_json(by_alias=True, exclude_none=True)
+new = json.loads(dump)
+if d := DeepDiff(some_json, new, ignore_order=True):
+    pprint(d)  # Should be empty if the JSON matches the model
+else:
+    print("No differences found between the JSON and the model dump.")
+
+# No differences found between the JSON and the model dump.
+
+# The dump validated the other devices without keeping them, membership only looks at the raw keys
+print(len(devices.devices._models), "console2" in devices.devices, "firewall1" in devices.devices, devices.devices.get("firewall1"))
+
+# 1 True False None
+
+broken = DynamicDict({"random1": {"hostname": "Switch-1", "role": "core"}, "random2": {"hostname": "", "role": "core"}})
+print(broken.root["random1"].hostname)
+try:
+    broken.root.validate_all()
+except ValueError as e:
+    print(e)
+
+# Switch-1
+# 1 validation error for DynamicDevice
+# hostname
+#   String should have at least 1 character [type=string_too_short, input_value='', input_type=str]
+#     For further information visit https://errors.pydantic.dev/2.14/v/string_too_short
+
+big_json = {
+    f"random{i}": {"hostname": f"Switch-{i}", "role": "access", "addr": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/24"} for i in range(200_000)
+}
+start = perf_counter()
+devices = DynamicDict(big_json)
+print(f"lazy: {perf_counter() - start:.3f}s, {devices.root['random42'].hostname}")
+start = perf_counter()
+devices.root.validate_all()
+print(f"validate_all: {perf_counter() - start:.3f}s")
+
+# lazy: 0.022s, Switch-42
+# validate_all: 5.000s
@@ -0,0 +1,197 @@
+import codecs
+import io
+import json
+import re
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import Annotated, Any, BinaryIO, Iterator, Literal, Optional
+
+from netaddr import EUI, AddrFormatError
+from pydantic import AfterValidator, BaseModel, Field, PlainSerializer
+
+IntStr = Annotated[
+    int,
+    PlainSerializer(lambda x: str(x), return_type=str, when_used="always"),
+]
+
+
+def mac_address_validator(value: str) -> str:
+    try:
+        EUI(value)
+    except AddrFormatError as e:
+        raise ValueError(f"Invalid MAC address: {value}") from e
+    return value
+
+
+MacAddress = Annotated[
+    str,
+    AfterValidator(mac_address_validator),
+]
+
+
+class NetworkDevice(BaseModel):
+    instance_id: IntStr = Field(alias="instance-id")
+    hostname: str = Field(min_length=1)
+    type: Literal["EX4000", "EX4400"]
+    purpose: list[Literal["core", "access", "distribution"]]
+    rack: Optional[str] = None
+    mac: MacAddress
+
+
+class DeviceList(BaseModel):
+    devices: list[NetworkDevice]
+
+
+WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+
+def iter_ndjson_devices(stream: BinaryIO) -> Iterator[NetworkDevice]:
+    """One device per line, each line goes straight from bytes to the model."""
+    for line in stream:
+        if line.strip():
+            yield NetworkDevice.model_validate_json(line)
+
+
+def iter_array_devices(
+    stream: BinaryIO, key: str = "devices", chunk_size: int = 64 * 1024, max_item_size: int = 1024 * 1024
+) -> Iterator[NetworkDevice]:
+    """Devices from a top level {"devices": [...]} document, reading `chunk_size` bytes at a time.
+
+    Only the current chunk and the device being parsed are kept in memory. A
+    device, or the value of another top level key, that is not complete within
+    `max_item_size` characters is reported as invalid JSON instead of reading on.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    # Everything before `pos` is parsed, it is dropped once per read instead of once per device
+    buffer, pos, consumed = "", 0, 0
+    eof = False
+
+    def read_more() -> None:
+        nonlocal buffer, pos, consumed, eof
+        if eof:
+            raise ValueError("unexpected end of the JSON document")
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        consumed += pos
+        buffer = buffer[pos:] + text.decode(chunk, final=eof)
+        pos = 0
+
+    def peek() -> str:
+        nonlocal pos
+        while (pos := WHITESPACE.match(buffer, pos).end()) == len(buffer):
+            read_more()
+        return buffer[pos]
+
+    def expect(chars: str) -> str:
+        nonlocal pos
+        if (char := peek()) not in chars:
+            raise ValueError(f"expected one of {chars!r} at character {consumed + pos} of the JSON document, got {char!r}")
+        pos += 1
+        return char
+
+    def decode() -> Any:
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if eof or len(buffer) - pos > max_item_size:
+                    raise ValueError(f"{e.msg} at character {consumed + e.pos} of the JSON document") from None
+                read_more()
+                continue
+            # A number that ends at the end of the buffer may continue in the next chunk
+            if end < len(buffer) or eof:
+                pos = end
+                return value
+            read_more()
+
+    # Walk the keys of the top level object up to the list, skipping the values of other keys
+    expect("{")
+    if peek() == "}":
+        raise ValueError(f"no '{key}' list found")
+    while decode() != key:
+        expect(":")
+        decode()
+        if expect(",}") == "}":
+            raise ValueError(f"no '{key}' list found")
+    expect(":")
+    expect("[")
+    if peek() == "]":
+        return
+    while True:
+        yield NetworkDevice.model_validate(decode())
+        if expect(",]") == "]":
+            return
+
+
+network_json = {
+    "devices": [
+        {
+            "instance-id": str(i),
+            "hostname": f"Switch-{i}",
+            "type": "EX4400",
+            "purpose": ["core", "distribution"],
+            "rack": "Rack-1",
+            "mac": "00:1A:2B:3C:4D:5E",
+        }
+        for i in range(20_000)
+    ]
+}
+
+with tempfile.TemporaryDirectory() as tmp:
+    array_file = Path(tmp) / "devices.json"
+    array_file.write_text(json.dumps(network_json, indent=2))
+    ndjson_file = Path(tmp) / "devices.ndjson"
+    ndjson_file.write_text("\n".join(json.dumps(device) for device in network_json["devices"]))
+
+    tracemalloc.start()
+    with array_file.open("rb") as f:
+        devices = DeviceList(**json.load(f))
+    print(f"json.load + DeviceList: {len(devices.devices)} devices, peak {tracemalloc.get_traced_memory()[1] / 2**20:.1f} MiB")
+    del devices
+    tracemalloc.reset_peak()
+
+    with array_file.open("rb") as f:
+        count = sum(1 for _ in iter_array_devices(f))
+    print(f"streamed array: {count} devices, peak {tracemalloc.get_traced_memory()[1] / 2**20:.1f} MiB")
+    tracemalloc.reset_peak()
+
+    with ndjson_file.open("rb") as f:
+        count = sum(1 for _ in iter_ndjson_devices(f))
+    print(f"streamed ndjson: {count} devices, peak {tracemalloc.get_traced_memory()[1] / 2**20:.1f} MiB")
+    tracemalloc.stop()
+
+    # The parsed part of the buffer is dropped once per chunk, so the time does not grow with the chunk size
+    start = perf_counter()
+    DeviceList.model_validate_json(array_file.read_bytes())
+    print(f"whole document: {perf_counter() - start:.3f}s")
+    for chunk_size in (4 * 1024, 64 * 1024, 1024 * 1024):
+        with array_file.open("rb") as f:
+            start = perf_counter()
+            sum(1 for _ in iter_array_devices(f, chunk_size=chunk_size))
+        print(f"streamed array, {chunk_size // 1024:>4} KiB chunks: {perf_counter() - start:.3f}s")
+
+# json.load + DeviceList: 20000 devices, peak 36.2 MiB
+# streamed array: 20000 devices, peak 0.3 MiB
+# streamed ndjson: 20000 devices, peak 0.8 MiB
+# whole document: 0.267s
+# streamed array,    4 KiB chunks: 0.365s
+# streamed array,   64 KiB chunks: 0.367s
+# streamed array, 1024 KiB chunks: 0.387s
+
+# A broken device is reported once max_item_size characters are read, not at the end of the file
+broken = b'{"name": "devices", "devices": [{"hostname": oops}' + b", {}" * 1_000_000 + b"]}"
+try:
+    list(iter_array_devices(io.BytesIO(broken)))
+except ValueError as e:
+    print(e)
+
+# Expecting value at character 45 of the JSON document
+
+# A socket works the same way, through sock.makefile("rb"):
+# for device in iter_ndjson_devices(sock.makefile("rb")):
+#     ...
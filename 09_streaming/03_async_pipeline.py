@@ -0,0 +1,156 @@
+import asyncio
+import json
+import tempfile
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from ipaddress import IPv4Interface
+from pathlib import Path
+from typing import Literal, NamedTuple, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: str | list[str]
+    addr: Optional[IPv4Interface | list[IPv4Interface] | Literal[""]] = None
+
+
+class IngestError(NamedTuple):
+    source: str
+    line: bytes
+    error: ValidationError
+
+
+class Batch(NamedTuple):
+    source: str
+    lines: list[bytes]
+
+
+def validate_batch(batch: Batch) -> list[NetworkDevice | IngestError]:
+    """Runs in the executor, so the event loop keeps serving the sources."""
+    results = []
+    for line in batch.lines:
+        try:
+            results.append(NetworkDevice.model_validate_json(line))
+        except ValidationError as e:
+            results.append(IngestError(batch.source, line, e))
+    return results
+
+
+async def stream_lines(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    while line := await reader.readline():
+        yield line
+
+
+async def file_lines(path: Path, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    with path.open("rb") as f:
+        while lines := await asyncio.to_thread(f.readlines, chunk_size):
+            for line in lines:
+                yield line
+
+
+async def ingest(
+    sources: dict[str, AsyncIterator[bytes]],
+    executor: Optional[Executor] = None,
+    workers: int = 4,
+    batch_size: int = 500,
+    queue_size: int = 16,
+) -> AsyncIterator[NetworkDevice | IngestError]:
+    """Validate NDJSON devices from many sources at the same time.
+
+    Lines are validated in batches of `batch_size` in the executor (a thread pool
+    by default). Both queues hold at most `queue_size` batches, so a slow consumer
+    makes the workers wait, and waiting workers make the sources wait.
+    """
+    raw: asyncio.Queue[Optional[Batch]] = asyncio.Queue(queue_size)
+    done: asyncio.Queue[Optional[list]] = asyncio.Queue(queue_size)
+    loop = asyncio.get_running_loop()
+    own_executor = executor is None
+    executor = executor or ThreadPoolExecutor(workers)
+
+    async def read(name: str, source: AsyncIterator[bytes]) -> None:
+        lines = []
+        async for line in source:
+            if line.strip():
+                lines.append(line)
+            if len(lines) == batch_size:
+                await raw.put(Batch(name, lines))
+                lines = []
+        if lines:
+            await raw.put(Batch(name, lines))
+
+    async def validate() -> None:
+        while (batch := await raw.get()) is not None:
+            await done.put(await loop.run_in_executor(executor, validate_batch, batch))
+
+    async def run() -> None:
+        readers = [asyncio.create_task(read(name, source)) for name, source in sources.items()]
+        validators = [asyncio.create_task(validate()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*readers)
+            for _ in validators:
+                await raw.put(None)
+            await asyncio.gather(*validators)
+            await done.put(None)
+        finally:
+            # gather does not cancel the other sources when one of them fails
+            for task in readers + validators:
+                task.cancel()
+
+    runner = asyncio.create_task(run())
+    try:
+        while True:
+            getter = asyncio.ensure_future(done.get())
+            await asyncio.wait({getter, runner}, return_when=asyncio.FIRST_COMPLETED)
+            # A failing source stops the pipeline, instead of waiting for results that never come
+            if not getter.done() and runner.exception():
+                getter.cancel()
+                raise runner.exception()
+            if (results := await getter) is None:
+                break
+            for result in results:
+                yield result
+    finally:
+        runner.cancel()
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def ndjson(devices: Iterable[dict]) -> bytes:
+    return b"".join(json.dumps(device).encode() + b"\n" for device in devices)
+
+
+async def main() -> None:
+    devices = [{"hostname": f"Switch-{i}", "role": "access", "addr": f"10.0.{i >> 8 & 255}.{i & 255}/24"} for i in range(3_000)]
+    broken = [{"hostname": "", "role": "core"}]
+
+    # A local collector that sends its inventory over TCP
+    async def collector(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(ndjson(devices[:2_000] + broken))
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(collector, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "devices.ndjson"
+        path.write_bytes(ndjson(devices[2_000:]))
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        valid = 0
+        async for result in ingest({"tcp": stream_lines(reader), "file": file_lines(path)}):
+            if isinstance(result, IngestError):
+                print(f"{result.source}: {result.error.errors()[0]['msg']}")
+            else:
+                valid += 1
+        print(f"{valid} valid devices")
+        writer.close()
+    server.close()
+    await server.wait_closed()
+
+
+asyncio.run(main())
+
+# tcp: String should have at least 1 character
+# 3000 valid devices
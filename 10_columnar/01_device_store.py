@@ -0,0 +1,187 @@
+import sys
+import tracemalloc
+from array import array
+from ipaddress import IPv4Interface
+from typing import Annotated, Iterator, Literal, get_args
+
+from netaddr import EUI, AddrFormatError
+from pydantic import AfterValidator, BaseModel, Field
+
+
+def mac_address_validator(value: str) -> str:
+    try:
+        EUI(value)
+    except AddrFormatError as e:
+        raise ValueError(f"Invalid MAC address: {value}") from e
+    return value
+
+
+MacAddress = Annotated[
+    str,
+    AfterValidator(mac_address_validator),
+]
+
+Role = Literal["core", "access", "distribution"]
+ROLES = get_args(Role)
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: list[Role]
+    addr: IPv4Interface
+    mac: MacAddress
+
+
+class DeviceList(BaseModel):
+    devices: list[NetworkDevice]
+
+
+def roles_from_mask(mask: int) -> list[str]:
+    return [role for bit, role in enumerate(ROLES) if mask & 1 << bit]
+
+
+def format_mac(value: int) -> str:
+    return ":".join(f"{value:012X}"[i : i + 2] for i in range(0, 12, 2))
+
+
+class DeviceRow:
+    """Read-only view on one device of a DeviceStore, values are only built when read."""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "DeviceStore", index: int) -> None:
+        self._store = store
+        self._index = index
+
+    @property
+    def hostname(self) -> str:
+        return self._store.hostnames[self._index]
+
+    @property
+    def role(self) -> list[str]:
+        if (roles := self._store.role_overrides.get(self._index)) is not None:
+            return list(roles)
+        return roles_from_mask(self._store.roles[self._index])
+
+    @property
+    def addr(self) -> IPv4Interface:
+        return IPv4Interface((self._store.addrs[self._index], self._store.prefixlens[self._index]))
+
+    @property
+    def mac(self) -> str:
+        if (mac := self._store.mac_overrides.get(self._index)) is not None:
+            return mac
+        return format_mac(self._store.macs[self._index])
+
+    def model_dump(self) -> dict:
+        return {"hostname": self.hostname, "role": self.role, "addr": self.addr, "mac": self.mac}
+
+    def __repr__(self) -> str:
+        return f"DeviceRow({', '.join(f'{key}={val!r}' for key, val in self.model_dump().items())})"
+
+
+class DeviceStore:
+    """Columnar, read-only copy of a validated DeviceList.
+
+    Hostnames are interned, roles are a bitmask over ROLES, addresses are stored
+    as uint32 plus prefix length and MAC addresses as uint64. Roles that are not
+    in the order of ROLES or repeat a role, and MAC addresses not in the
+    00:1A:2B:3C:4D:5E form, are kept as they are in a small table per row, so
+    model_dump() gives back exactly what the DeviceList held.
+    """
+
+    __slots__ = ("hostnames", "roles", "addrs", "prefixlens", "macs", "role_overrides", "mac_overrides")
+
+    def __init__(self) -> None:
+        self.hostnames: list[str] = []
+        self.roles = array("B")
+        self.addrs = array("I")
+        self.prefixlens = array("B")
+        self.macs = array("Q")
+        self.role_overrides: dict[int, tuple[str, ...]] = {}
+        self.mac_overrides: dict[int, str] = {}
+
+    @classmethod
+    def from_device_list(cls, devices: DeviceList) -> "DeviceStore":
+        store = cls()
+        for index, device in enumerate(devices.devices):
+            store.hostnames.append(sys.intern(device.hostname))
+            mask = sum(1 << ROLES.index(role) for role in set(device.role))
+            store.roles.append(mask)
+            if roles_from_mask(mask) != device.role:
+                store.role_overrides[index] = tuple(sys.intern(role) for role in device.role)
+            store.addrs.append(int(device.addr.ip))
+            store.prefixlens.append(device.addr.network.prefixlen)
+            mac = int(EUI(device.mac))
+            store.macs.append(mac)
+            if format_mac(mac) != device.mac:
+                store.mac_overrides[index] = device.mac
+        return store
+
+    def __len__(self) -> int:
+        return len(self.hostnames)
+
+    def __getitem__(self, index: int) -> DeviceRow:
+        if not -len(self) <= index < len(self):
+            raise IndexError("device index out of range")
+        return DeviceRow(self, index % len(self))
+
+    def __iter__(self) -> Iterator[DeviceRow]:
+        return (DeviceRow(self, index) for index in range(len(self)))
+
+    def model_dump(self) -> dict:
+        return {"devices": [row.model_dump() for row in self]}
+
+
+network_json = {
+    "devices": [
+        {
+            "hostname": "Switch-1",
+            "role": ["core", "distribution"],
+            "addr": "192.168.1.1/24",
+            "mac": "00:1A:2B:3C:4D:5E",
+        },
+        {
+            "hostname": "Switch-11",
+            "role": ["access"],
+            "addr": "192.168.2.1/24",
+            "mac": "00:1A:2B:3C:4D:5F",
+        },
+        {
+            "hostname": "Switch-88",
+            "role": ["distribution", "core"],
+            "addr": "192.168.3.1/24",
+            "mac": "001a.2b3c.4d60",
+        },
+    ]
+}
+devices = DeviceList(**network_json)
+store = DeviceStore.from_device_list(devices)
+print(store[1])
+print(store[2].role, store[2].mac)
+print(store.model_dump() == devices.model_dump())
+
+# DeviceRow(hostname='Switch-11', role=['access'], addr=IPv4Interface('192.168.2.1/24'), mac='00:1A:2B:3C:4D:5F')
+# ['distribution', 'core'] 001a.2b3c.4d60
+# True
+
+big_json = {
+    "devices": [
+        {
+            "hostname": f"Switch-{i}",
+            "role": ["access"] if i % 4 else ["core", "distribution"],
+            "addr": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/24",
+            "mac": f"00:1A:{i >> 24 & 255:02X}:{i >> 16 & 255:02X}:{i >> 8 & 255:02X}:{i & 255:02X}",
+        }
+        for i in range(50_000)
+    ]
+}
+tracemalloc.start()
+devices = DeviceList(**big_json)
+models = tracemalloc.get_traced_memory()[0]
+store = DeviceStore.from_device_list(devices)
+del devices
+print(f"DeviceList: {models / 2**20:.1f} MiB, DeviceStore: {tracemalloc.get_traced_memory()[0] / 2**20:.1f} MiB")
+tracemalloc.stop()
+
+# DeviceList: 55.6 MiB, DeviceStore: 3.0 MiB
@@ -0,0 +1,163 @@
+import json
+from functools import cache
+from ipaddress import IPv4Interface
+from time import perf_counter
+from typing import Annotated, Any, Literal, NamedTuple, Optional
+
+from deepdiff import DeepDiff
+from pydantic import BaseModel, BeforeValidator, Field, RootModel, TypeAdapter
+from rich import print as pprint
+
+ListStr = Annotated[
+    list[str],
+    BeforeValidator(lambda v: [v] if isinstance(v, str) else v),
+]
+
+MISSING = object()
+
+
+class Difference(NamedTuple):
+    path: str
+    source: Any
+    dumped: Any
+
+
+@cache
+def field_adapter(model: type[BaseModel], name: str) -> TypeAdapter:
+    field = model.model_fields[name]
+    # Validators and constraints like the ListStr BeforeValidator end up in the field metadata
+    return TypeAdapter(Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation)
+
+
+def is_coercion(model: type[BaseModel], name: str, source: Any, dumped: Any) -> bool:
+    """True when validating `source` for this field and dumping it gives `dumped`, like "access" -> ["access"]."""
+    adapter = field_adapter(model, name)
+    try:
+        return adapter.dump_python(adapter.validate_python(source), mode="json") == dumped
+    except ValueError:
+        return False
+
+
+def round_trip_diff(value: Any, source: Any, dumped: Any, path: str = "root") -> list[Difference]:
+    """Compare the source data with the dump of the model validated from it, in one walk.
+
+    `value` is the validated model, it tells which field, alias and model class
+    belongs to each part of the data. Only values that differ are looked at in
+    detail, expected coercions and None values left out by exclude_none are not
+    reported. Lists are compared in order.
+    """
+    if isinstance(value, RootModel):
+        return round_trip_diff(value.root, source, dumped, path)
+    if source == dumped:
+        return []
+    if isinstance(value, BaseModel) and isinstance(source, dict) and isinstance(dumped, dict):
+        differences = []
+        model = type(value)
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            src, dmp = source.get(key, MISSING), dumped.get(key, MISSING)
+            if src == dmp or (dmp is MISSING and src is None):
+                continue
+            field_value = getattr(value, name)
+            if isinstance(field_value, (BaseModel, list, dict)) and _holds_models(field_value):
+                differences.extend(round_trip_diff(field_value, src, dmp, f"{path}['{key}']"))
+            elif src is MISSING or dmp is MISSING or not is_coercion(model, name, src, dmp):
+                differences.append(Difference(f"{path}['{key}']", src, dmp))
+        known = _keys(model)
+        differences.extend(Difference(f"{path}['{key}']", source[key], MISSING) for key in source if key not in dumped and key not in known)
+        return differences
+    if isinstance(value, dict) and isinstance(source, dict) and isinstance(dumped, dict):
+        differences = []
+        # The keys of the source and then the extra keys of the dump, so the report order is stable
+        for key in [*source, *(key for key in dumped if key not in source)]:
+            src, dmp = source.get(key, MISSING), dumped.get(key, MISSING)
+            if key in value:
+                differences.extend(round_trip_diff(value[key], src, dmp, f"{path}['{key}']"))
+            else:
+                differences.append(Difference(f"{path}['{key}']", src, dmp))
+        return differences
+    if isinstance(value, list) and isinstance(source, list) and isinstance(dumped, list) and len(source) == len(dumped) == len(value):
+        differences = []
+        for index, (item, src, dmp) in enumerate(zip(value, source, dumped)):
+            differences.extend(round_trip_diff(item, src, dmp, f"{path}[{index}]"))
+        return differences
+    return [Difference(path, source, dumped)]
+
+
+def _holds_models(value: Any) -> bool:
+    if isinstance(value, BaseModel):
+        return True
+    items = value.values() if isinstance(value, dict) else value
+    return any(isinstance(item, BaseModel) for item in items)
+
+
+@cache
+def _keys(model: type[BaseModel]) -> set[str]:
+    return {field.alias or name for name, field in model.model_fields.items()}
+
+
+class NetworkDevice(BaseModel):
+    hostname: str = Field(min_length=1)
+    role: ListStr
+    addr: Optional[IPv4Interface | list[IPv4Interface] | Literal[""]] = None
+    instance_id: Optional[int] = Field(None, alias="instance-id")
+
+
+class DynamicDict(RootModel[dict[str, NetworkDevice]]):
+    pass
+
+
+some_json = {
+    "random1": {
+        "hostname": "Switch-1",
+        "role": ["core", "distribution"],
+        "addr": ["192.168.1.1/24"],
+    },
+    "random2": {
+        "hostname": "Switch-11",
+        "role": "access",
+        "addr": "192.168.2.1/24",
+        "instance-id": "12",
+    },
+    "random3": {
+        "hostname": "Switch-88",
+        "role": "core",
+        "addr": None,
+    },
+}
+devices = DynamicDict(some_json)
+
+dump = json.loads(devices.model_dump_json(by_alias=True, exclude_none=True))
+pprint(round_trip_diff(devices, some_json, dump))
+
+# []
+
+dump["random1"]["hostname"] = "Switch-2"
+dump["random2"]["instance-id"] = 13
+pprint(round_trip_diff(devices, some_json, dump))
+
+# [
+#     Difference(
+#         path="root['random1']['hostname']",
+#         source='Switch-1',
+#         dumped='Switch-2'
+#     ),
+#     Difference(path="root['random2']['instance-id']", source='12', dumped=13)
+# ]
+
+big_json = {
+    f"random{i}": {"hostname": f"Switch-{i}", "role": "access", "addr": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/24"} for i in range(20_000)
+}
+devices = DynamicDict(big_json)
+dump = json.loads(devices.model_dump_json(by_alias=True, exclude_none=True))
+for name, check in (
+    ("DeepDiff", lambda: DeepDiff(big_json, dump, ignore_order=True)),
+    ("round_trip_diff", lambda: round_trip_diff(devices, big_json, dump)),
+):
+    start = perf_counter()
+    check()
+    print(f"{name:<16} {perf_counter() - start:.3f}s")
+
+# DeepDiff         4.472s
+# round_trip_diff  0.314s
+# DeepDiff also reports every "role": "access" -> ["access"] as a type change, round_trip_diff reports nothing.
@@ -0,0 +1,170 @@
+import os
+import tempfile
+from collections import defaultdict
+from ipaddress import IPv4Interface
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Annotated, Any, Callable, Literal, Optional
+
+from netaddr import EUI, AddrFormatError
+from pydantic import AfterValidator, BaseModel, BeforeValidator, Field, PlainSerializer, WrapValidator
+
+
+class Timing:
+    """Opt-in call counts, time and failures per validator, model and field.
+
+    When disabled the helpers give back the plain validators and serializers,
+    so the models are exactly the same as without instrumentation.
+    """
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        # (hook, type, model, field) -> [calls, nanoseconds, failures]
+        self.counters: defaultdict[tuple[str, str, str, str], list[int]] = defaultdict(lambda: [0, 0, 0])
+
+    def _timed(self, hook: str, name: str, call: Callable[[], Any], info: Any) -> Any:
+        # Validators know the model (config title) and field, serializers do not
+        config = getattr(info, "config", None) or {}
+        counter = self.counters[hook, name, config.get("title", ""), getattr(info, "field_name", None) or ""]
+        counter[0] += 1
+        start = perf_counter_ns()
+        try:
+            return call()
+        except Exception:
+            counter[2] += 1
+            raise
+        finally:
+            counter[1] += perf_counter_ns() - start
+
+    def after(self, func: Callable[[Any], Any], name: str) -> AfterValidator:
+        if not self.enabled:
+            return AfterValidator(func)
+        return AfterValidator(lambda v, info: self._timed("after", name, lambda: func(v), info))
+
+    def before(self, func: Callable[[Any], Any], name: str) -> BeforeValidator:
+        if not self.enabled:
+            return BeforeValidator(func)
+        return BeforeValidator(lambda v, info: self._timed("before", name, lambda: func(v), info))
+
+    def plain_serializer(self, func: Callable[[Any], Any], name: str, **kwargs: Any) -> PlainSerializer:
+        # The serialization info does not know the field, so only `name` tells them apart
+        if not self.enabled:
+            return PlainSerializer(func, **kwargs)
+        return PlainSerializer(lambda v, info: self._timed("serializer", name, lambda: func(v), info), **kwargs)
+
+    def core(self, name: str) -> Optional[WrapValidator]:
+        """Time pydantic's own validation of a type, like IPv4Interface, put it right after the type."""
+        if not self.enabled:
+            return None  # Annotated metadata that pydantic ignores
+        return WrapValidator(lambda v, handler, info: self._timed("core", name, lambda: handler(v), info))
+
+    def prometheus_text(self) -> str:
+        lines = []
+        for metric, index, scale, help_text in (
+            ("pydantic_validator_calls_total", 0, 1, "Number of calls."),
+            ("pydantic_validator_seconds_total", 1, 1e-9, "Time spent in the call."),
+            ("pydantic_validator_failures_total", 2, 1, "Number of calls that raised."),
+        ):
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            for (hook, name, model, field), counter in sorted(self.counters.items()):
+                labels = f'hook="{hook}",type="{name}",model="{model}",field="{field}"'
+                lines.append(f"{metric}{{{labels}}} {counter[index] * scale:g}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path) -> None:
+        """Write a snapshot for a textfile collector, replacing the old one in one step."""
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(self.prometheus_text())
+        tmp.replace(path)
+
+
+timing = Timing(enabled=os.environ.get("VALIDATOR_TIMING") == "1")
+
+
+def mac_address_validator(value: str) -> str:
+    try:
+        EUI(value)
+    except AddrFormatError as e:
+        raise ValueError(f"Invalid MAC address: {value}") from e
+    return value
+
+
+IntStr = Annotated[
+    int,
+    timing.plain_serializer(lambda x: str(x), "IntStr", return_type=str, when_used="always"),
+]
+
+MacAddress = Annotated[
+    str,
+    timing.after(mac_address_validator, "MacAddress"),
+]
+
+ListStr = Annotated[
+    list[str],
+    timing.before(lambda v: [v] if isinstance(v, str) else v, "ListStr"),
+]
+
+
+class NetworkDevice(BaseModel):
+    instance_id: IntStr = Field(alias="instance-id")
+    hostname: str = Field(min_length=1)
+    type: Literal["EX4000", "EX4400"]
+    role: ListStr
+    addr: Annotated[IPv4Interface, timing.core("IPv4Interface")]
+    mac: MacAddress
+
+
+class DeviceList(BaseModel):
+    devices: list[NetworkDevice]
+
+
+network_json = {
+    "devices": [
+        {
+            "instance-id": "151",
+            "hostname": "Switch-1",
+            "type": "EX4400",
+            "role": ["core", "distribution"],
+            "addr": "192.168.1.1/24",
+            "mac": "00:1A:2B:3C:4D:5E",
+        },
+        {
+            "instance-id": "263",
+            "hostname": "Switch-11",
+            "type": "EX4000",
+            "role": "access",
+            "addr": "192.168.2.1/24",
+            "mac": "00:1A:2B:3C:4D:5F",
+        },
+    ]
+}
+devices = DeviceList(**network_json)
+devices.model_dump_json(by_alias=True)
+try:
+    NetworkDevice(**{**network_json["devices"][0], "mac": "00:1A:2B:3C:4D:5G"})
+except ValueError:
+    pass
+
+with tempfile.TemporaryDirectory() as tmp:
+    timing.write_textfile(Path(tmp) / "pydantic.prom")
+    print((Path(tmp) / "pydantic.prom").read_text())
+
+# VALIDATOR_TIMING=1 python 12_instrumentation/01_validator_timing.py
+# # HELP pydantic_validator_calls_total Number of calls.
+# # TYPE pydantic_validator_calls_total counter
+# pydantic_validator_calls_total{hook="after",type="MacAddress",model="NetworkDevice",field="mac"} 3
+# pydantic_validator_calls_total{hook="before",type="ListStr",model="NetworkDevice",field="role"} 3
+# pydantic_validator_calls_total{hook="core",type="IPv4Interface",model="NetworkDevice",field="addr"} 3
+# pydantic_validator_calls_total{hook="serializer",type="IntStr",model="",field=""} 2
+# # HELP pydantic_validator_seconds_total Time spent in the call.
+# # TYPE pydantic_validator_seconds_total counter
+# pydantic_validator_seconds_total{hook="after",type="MacAddress",model="NetworkDevice",field="mac"} 0.000117916
+# pydantic_validator_seconds_total{hook="before",type="ListStr",model="NetworkDevice",field="role"} 6.25e-06
+# pydantic_validator_seconds_total{hook="core",type="IPv4Interface",model="NetworkDevice",field="addr"} 0.000145939
+# pydantic_validator_seconds_total{hook="serializer",type="IntStr",model="",field=""} 3.39e-06
+# # HELP pydantic_validator_failures_total Number of calls that raised.
+# # TYPE pydantic_validator_failures_total counter
+# pydantic_validator_failures_total{hook="after",type="MacAddress",model="NetworkDevice",field="mac"} 1
+# pydantic_validator_failures_total{hook="before",type="ListStr",model="NetworkDevice",field="role"} 0
+# pydantic_validator_failures_total{hook="core",type="IPv4Interface",model="NetworkDevice",field="addr"} 0
+# pydantic_validator_failures_total{hook="serializer",type="IntStr",model="",field=""} 0
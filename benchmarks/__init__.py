@@ -0,0 +1,4 @@
+"""Throughput benchmarks for the models used in the series.
+
+Run with `python -m benchmarks --help`.
+"""
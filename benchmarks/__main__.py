@@ -0,0 +1,29 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from rich import print as pprint
+
+from benchmarks.runner import CASES, compare, run
+
+parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the models of the series.")
+parser.add_argument("--case", action="append", choices=CASES, help="case to run, can be repeated (default: all)")
+parser.add_argument("--size", action="append", type=int, help="number of devices, can be repeated (default: 1000 and 10000)")
+parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (default: 5)")
+parser.add_argument("--output", type=Path, help="write the results as JSON to this file")
+parser.add_argument("--compare", type=Path, metavar="BASELINE", help="flag regressions against the results in this file")
+parser.add_argument("--threshold", type=float, default=0.1, help="allowed ops/sec drop before it counts as a regression (default: 0.1)")
+args = parser.parse_args()
+
+results = run(args.case or list(CASES), args.size or [1_000, 10_000], args.repeat)
+if args.output:
+    args.output.write_text(json.dumps(results, indent=2))
+else:
+    print(json.dumps(results, indent=2))
+
+if args.compare:
+    if regressions := compare(results, json.loads(args.compare.read_text()), args.threshold):
+        pprint("\n".join(regressions))
+        sys.exit(1)
+    print("No regressions found compared to the baseline.")
@@ -0,0 +1,73 @@
+"""Synthetic input data, `n` devices (or users) for every shape in the series."""
+
+from typing import Any
+
+
+def ip(i: int) -> str:
+    return f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/24"
+
+
+def mac(i: int) -> str:
+    return ":".join(f"{i:012X}"[j : j + 2] for j in range(0, 12, 2))
+
+
+def users(n: int) -> dict[str, Any]:
+    return {"users": [{"id": i, "name": f"User {i}", "email": f"user{i}@example.com"} for i in range(n)]}
+
+
+def mac_devices(n: int) -> dict[str, Any]:
+    return {
+        "devices": [
+            {
+                "instance-id": str(i),
+                "hostname": f"Switch-{i}",
+                "type": "EX4400" if i % 2 else "EX4000",
+                "purpose": ["core", "distribution"] if i % 10 == 0 else ["access"],
+                **({"rack": f"Rack-{i // 40}"} if i % 3 else {}),
+                "mac": mac(i),
+            }
+            for i in range(n)
+        ]
+    }
+
+
+def port_devices(n: int) -> dict[str, Any]:
+    return {
+        "devices": [
+            {
+                "hostname": f"Switch-{i}",
+                "type": "EX4400",
+                "purpose": ["access"],
+                "port": f"{('xe', 'ge', 'et')[i % 3]}-0/0/{i % 48}" + (":1" if i % 5 == 0 else ""),
+            }
+            for i in range(n)
+        ]
+    }
+
+
+def addr_device(i: int) -> dict[str, Any]:
+    # The three shapes of the addr union: a list, a single interface and ""
+    addr = [ip(i)] if i % 3 == 0 else ip(i) if i % 3 == 1 else ""
+    return {"hostname": f"Switch-{i}", "role": "access" if i % 2 else ["core", "distribution"], "addr": addr}
+
+
+def addr_devices(n: int) -> dict[str, Any]:
+    return {"devices": [addr_device(i) for i in range(n)]}
+
+
+def dynamic_dict(n: int) -> dict[str, Any]:
+    return {f"random{i}": addr_device(i) for i in range(n)}
+
+
+def registry_devices(n: int) -> dict[str, Any]:
+    devices = {}
+    for i in range(n):
+        base = {"hostname": f"Device-{i}", "role": ["core"], "addr": ip(i)}
+        match i % 3:
+            case 0:
+                devices[f"rtr{i}"] = {**base, "monitor": bool(i % 2)}
+            case 1:
+                devices[f"switch{i}"] = {**base, "id": i}
+            case _:
+                devices[f"console{i}"] = {**base, "instance-id": i}
+    return {"devices": devices}
@@ -0,0 +1,163 @@
+"""The models of the series, copied here because the numbered folders can not be imported."""
+
+from ipaddress import IPv4Interface
+from typing import Annotated, Iterator, Literal, Optional
+
+from netaddr import EUI, AddrFormatError
+from pydantic import AfterValidator, BaseModel, Field, PlainSerializer, RootModel, ValidationError
+
+from benchmarks.registry import LAZY_CONFIG, LazyModel
+
+# 01_basics
+
+
+class User(LazyModel):
+    id: int
+    name: str
+    email: str
+
+
+class UserList(LazyModel):
+    users: list[User]
+
+
+# 03_annotations
+
+IntStr = Annotated[
+    int,
+    PlainSerializer(lambda x: str(x), return_type=str, when_used="always"),
+]
+
+
+def mac_address_validator(value: str) -> str:
+    try:
+        EUI(value)
+    except AddrFormatError as e:
+        raise ValueError(f"Invalid MAC address: {value}") from e
+    return value
+
+
+MacAddress = Annotated[
+    str,
+    AfterValidator(mac_address_validator),
+]
+
+
+class MacNetworkDevice(LazyModel):
+    instance_id: IntStr = Field(alias="instance-id")
+    hostname: str = Field(min_length=1)
+    type: Literal["EX4000", "EX4400"]
+    purpose: list[Literal["core", "access", "distribution"]]
+    rack: Optional[str] = None
+    mac: MacAddress
+
+
+class MacDeviceList(LazyModel):
+    devices: list[MacNetworkDevice]
+
+
+# 04_some_regex
+
+
+class PortNetworkDevice(LazyModel):
+    hostname: str = Field(min_length=1)
+    type: Literal["EX4000", "EX4400"]
+    purpose: list[Literal["core", "access", "distribution"]]
+    rack: Optional[str] = None
+    port: str = Field(default=None, pattern=r"^(xe|ge|et)-\d+/\d+/\d+(:\d+)?$")
+
+
+class PortDeviceList(LazyModel):
+    devices: list[PortNetworkDevice]
+
+
+# 05_double_typed_data and 06_dict_root
+
+
+class NetworkDevice(LazyModel):
+    hostname: str = Field(min_length=1)
+    role: str | list[str]
+    addr: Optional[IPv4Interface | list[IPv4Interface] | Literal[""]] = None
+
+
+class AddrDeviceList(LazyModel):
+    devices: list[NetworkDevice]
+
+
+class DynamicDict(RootModel[dict[str, NetworkDevice]]):
+    model_config = LAZY_CONFIG
+
+
+# 07_own_validator
+
+
+class BaseNetworkDevice(LazyModel):
+    hostname: str = Field(min_length=1)
+    role: list[str]
+    addr: IPv4Interface
+
+
+class NetworkDeviceRtr(BaseNetworkDevice):
+    monitor: bool
+
+
+class NetworkDeviceNewRtr(LazyModel):
+    hostname: str = Field(min_length=1)
+    role: list[str]
+    addr: IPv4Interface
+    monitor: bool
+
+
+class NetworkDeviceSwitch(BaseNetworkDevice):
+    id: int
+
+
+class NetworkDeviceConsole(BaseNetworkDevice):
+    instance_id: Optional[int] = Field(None, alias="instance-id")
+
+
+NETWORK_DEVICE_REGISTRY = {
+    "rtr": NetworkDeviceRtr,
+    "switch": NetworkDeviceSwitch,
+    "console": NetworkDeviceConsole,
+}
+
+
+class NetworkDeviceDict(dict[str, BaseModel]):
+    @classmethod
+    def __get_validators__(cls) -> Iterator:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: dict[str, dict], info=None) -> "NetworkDeviceDict":  # noqa: ARG003
+        if not isinstance(value, dict):
+            raise TypeError("devices must be a dict")
+        result = {}
+        for key, val in value.items():
+            if key.startswith("rtr"):
+                key_name = "rtr"
+            elif key.startswith("switch"):
+                key_name = "switch"
+            elif key.startswith("console"):
+                key_name = "console"
+            else:
+                raise ValueError(f"key '{key}' not lookup logic for devices")
+            model_class = NETWORK_DEVICE_REGISTRY.get(key_name)
+            if not model_class:
+                raise ValueError(f"key '{key}' not in NETWORK_DEVICE_REGISTRY")
+            try:
+                result[key] = model_class(**val)
+            except ValidationError as e:
+                print(f"Validation error for {key}: {e}")
+        return cls(result)
+
+
+class RegistryDeviceList(LazyModel):
+    devices: NetworkDeviceDict
+
+
+class UnionDeviceList(LazyModel):
+    devices: dict[
+        str,
+        NetworkDeviceNewRtr | NetworkDeviceConsole | NetworkDeviceSwitch | NetworkDeviceRtr,
+    ]
@@ -0,0 +1,20 @@
+"""Build the model schemas on first use.
+
+Short-lived jobs only use a few of the models, building the core schema of
+every model at import time is wasted work for them. Set MODEL_EAGER_BUILD=1
+to build everything at import, as pydantic does by default.
+"""
+
+import os
+
+from pydantic import BaseModel, ConfigDict
+
+EAGER_BUILD = os.environ.get("MODEL_EAGER_BUILD") == "1"
+
+LAZY_CONFIG = ConfigDict(defer_build=not EAGER_BUILD)
+
+
+class LazyModel(BaseModel):
+    """Base model that builds its schema and validator on the first validate."""
+
+    model_config = LAZY_CONFIG
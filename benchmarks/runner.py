@@ -0,0 +1,89 @@
+"""Measure validate, dump, dump to JSON and the JSON round-trip for every model."""
+
+import platform
+import statistics
+import tracemalloc
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any, NamedTuple
+
+import pydantic
+from pydantic import BaseModel
+
+from benchmarks import generators, models
+
+
+class Case(NamedTuple):
+    model: type[BaseModel]
+    generate: Callable[[int], Any]
+
+
+CASES = {
+    "UserList": Case(models.UserList, generators.users),
+    "MacDeviceList": Case(models.MacDeviceList, generators.mac_devices),
+    "PortDeviceList": Case(models.PortDeviceList, generators.port_devices),
+    "AddrDeviceList": Case(models.AddrDeviceList, generators.addr_devices),
+    "DynamicDict": Case(models.DynamicDict, generators.dynamic_dict),
+    "RegistryDeviceList": Case(models.RegistryDeviceList, generators.registry_devices),
+    "UnionDeviceList": Case(models.UnionDeviceList, generators.registry_devices),
+}
+
+DUMP_ARGS = {"by_alias": True, "exclude_none": True}
+
+
+def operations(model: type[BaseModel], data: Any) -> dict[str, Callable[[], Any]]:
+    instance = model.model_validate(data)
+    return {
+        "validate": lambda: model.model_validate(data),
+        "model_dump": lambda: instance.model_dump(**DUMP_ARGS),
+        "model_dump_json": lambda: instance.model_dump_json(**DUMP_ARGS),
+        # Dump to JSON and validate it again, both halves are timed
+        "round_trip": lambda: model.model_validate_json(instance.model_dump_json(**DUMP_ARGS)),
+    }
+
+
+def measure(operation: Callable[[], Any], size: int, repeat: int) -> dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        operation()
+        timings.append(perf_counter() - start)
+    # Peak memory in a separate run, tracemalloc slows everything down
+    tracemalloc.start()
+    operation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    # A handful of runs gives no real tail percentile, the slowest run is reported as it is
+    return {
+        "ops_per_sec": size / statistics.median(timings),
+        "p50_ms": statistics.median(timings) * 1e3,
+        "max_ms": max(timings) * 1e3,
+        "peak_mib": peak / 2**20,
+    }
+
+
+def run(cases: list[str], sizes: list[int], repeat: int) -> dict[str, Any]:
+    results = []
+    for name in cases:
+        case = CASES[name]
+        for size in sizes:
+            for op, operation in operations(case.model, case.generate(size)).items():
+                results.append({"case": name, "size": size, "op": op, **measure(operation, size, repeat)})
+    return {
+        "meta": {"python": platform.python_version(), "pydantic": pydantic.VERSION, "repeat": repeat},
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Regressions of more than `threshold` (0.1 is 10%) in ops/sec against the baseline."""
+    previous = {(r["case"], r["size"], r["op"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        if (old := previous.get((result["case"], result["size"], result["op"]))) is None:
+            continue
+        change = result["ops_per_sec"] / old["ops_per_sec"] - 1
+        if change < -threshold:
+            name = f"{result['case']} {result['op']} n={result['size']}"
+            regressions.append(f"{name}: {old['ops_per_sec']:,.0f} -> {result['ops_per_sec']:,.0f} ops/sec ({change:+.1%})")
+    return regressions
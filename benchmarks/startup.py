@@ -0,0 +1,68 @@
+"""Startup time of a short-lived job: import the models and validate the first input.
+
+Every measurement runs in a fresh interpreter, once with the deferred schema
+build and once with MODEL_EAGER_BUILD=1.
+
+    python -m benchmarks.startup --case MacDeviceList --repeat 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmarks.runner import CASES
+
+CHILD = """
+import json
+from time import perf_counter
+
+start = perf_counter()
+from benchmarks.runner import CASES
+
+imported = perf_counter()
+case = CASES[{case!r}]
+case.model.model_validate(case.generate(1))
+validated = perf_counter()
+print(json.dumps({{"import_ms": (imported - start) * 1e3, "first_validate_ms": (validated - imported) * 1e3}}))
+"""
+
+
+def measure(case: str, eager: bool) -> dict[str, float]:
+    env = {**os.environ, "MODEL_EAGER_BUILD": "1" if eager else "0"}
+    output = subprocess.run([sys.executable, "-c", CHILD.format(case=case)], env=env, capture_output=True, check=True, text=True).stdout
+    return json.loads(output)
+
+
+def run(cases: list[str], repeat: int) -> list[dict]:
+    results = []
+    for case in cases:
+        for eager in (True, False):
+            timings = [measure(case, eager) for _ in range(repeat)]
+            import_ms = statistics.median(t["import_ms"] for t in timings)
+            validate_ms = statistics.median(t["first_validate_ms"] for t in timings)
+            results.append(
+                {
+                    "case": case,
+                    "build": "eager" if eager else "deferred",
+                    "import_ms": import_ms,
+                    "first_validate_ms": validate_ms,
+                    "total_ms": import_ms + validate_ms,
+                }
+            )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description="Import to first validate time of the models.")
+    parser.add_argument("--case", action="append", choices=CASES, help="case to run, can be repeated (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per measurement (default: 5)")
+    args = parser.parse_args()
+
+    for result in run(args.case or list(CASES), args.repeat):
+        print(
+            f"{result['case']:<20} {result['build']:<9} import {result['import_ms']:6.1f}ms"
+            f" first validate {result['first_validate_ms']:6.1f}ms total {result['total_ms']:6.1f}ms"
+        )